@@ -13,14 +13,27 @@ import logging
 import argparse
 import configparser
 import signal
+import socket
 import getpass
+import html
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from bs4 import BeautifulSoup
 
+# lxml is optional; it allows directory listings to be parsed incrementally
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
 
 # ANSI color codes for terminal output
 class Colors:
@@ -43,6 +56,21 @@ class Colors:
     BG_BLUE = "\033[44m"
 
 
+class NoColors:
+    """Empty color codes, used when the terminal doesn't support colors."""
+
+    RESET = RED = GREEN = YELLOW = BLUE = PURPLE = CYAN = WHITE = BOLD = ""
+
+    # Background colors
+    BG_RED = BG_GREEN = BG_YELLOW = BG_BLUE = ""
+
+
+def disable_colors() -> None:
+    """Switch all colored console output to plain text."""
+    global Colors
+    Colors = NoColors
+
+
 # Custom log formatter with colors
 class ColoredFormatter(logging.Formatter):
     """Custom log formatter that adds colors based on log level."""
@@ -101,19 +129,21 @@ def setup_logging(level=logging.INFO):
 logger = setup_logging()
 
 
-# Global variable to track if the program should terminate
-terminate_requested = False
+# Set when the program should terminate; shared by all download threads
+TERMINATE = threading.Event()
+
+# Serializes console output from concurrent download workers
+console_lock = threading.Lock()
 
 
 # Signal handler for graceful termination
 def signal_handler(sig, frame):
     """Handle termination signals (like Ctrl+C)."""
-    global terminate_requested
-    if not terminate_requested:
+    if not TERMINATE.is_set():
         print(
             f"\n\n{Colors.YELLOW}Termination requested. Completing current operation...{Colors.RESET}"
         )
-        terminate_requested = True
+        TERMINATE.set()
     else:
         print(
             f"\n\n{Colors.RED}Forced termination. Some files may be incomplete.{Colors.RESET}"
@@ -126,7 +156,98 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 
-@dataclass
+# Size strings in directory listings, e.g. '176M' or '1.5G'
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)([KMGT])?")
+
+# Byte multipliers for the size units used in directory listings
+_UNIT_MUL = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+# File rows in an Apache-style directory listing: (href, last modified, size)
+_ROW_RE = re.compile(
+    r'<a href="([^"?/][^"]*)"[^>]*>[^<]*</a>\s*</td>\s*'
+    r"<td[^>]*>([^<]*)</td>\s*"
+    r"<td[^>]*>([^<]*)</td>",
+    re.IGNORECASE,
+)
+
+# Total size in a Content-Range header, e.g. 'bytes 1000-50000/50001'
+_CONTENT_RANGE_RE = re.compile(r"/(\d+)")
+
+# Units used by format_size, one per power of 1024, and their divisors
+_SIZE_UNITS = ("B", "kiB", "MiB", "GiB")
+_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_SIZE_UNITS)))
+
+# Buffer size for files being downloaded, so most writes skip the syscall
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of filtered out file names kept for the final summary
+_FILTERED_NAMES_SHOWN = 10
+
+# Download chunks are at least this large and a whole number of pages
+_MIN_CHUNK_SIZE = 64 * 1024
+_PAGE_SIZE = 4096
+
+# Errors raised while a download is in progress. Reading the raw response
+# raises urllib3 errors that requests would otherwise have wrapped.
+_TRANSFER_ERRORS = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError)
+
+
+class SocketTunedAdapter(HTTPAdapter):
+    """HTTPAdapter that can set the socket receive buffer size."""
+
+    def __init__(self, recv_buffer_size: int = 0, **kwargs):
+        """
+        Initialize the adapter.
+
+        Args:
+            recv_buffer_size: SO_RCVBUF size in bytes, 0 to keep the OS default
+            **kwargs: Arguments passed on to HTTPAdapter
+        """
+        # Must be set first, HTTPAdapter creates the pool manager in __init__
+        self.recv_buffer_size = recv_buffer_size
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.recv_buffer_size > 0:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_RCVBUF, self.recv_buffer_size)
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(
+    username: str, password: str, pool_size: int = 16, recv_buffer_size: int = 0
+) -> requests.Session:
+    """
+    Create an authenticated HTTP session with a keep-alive connection pool.
+
+    Args:
+        username: Authentication username
+        password: Authentication password
+        pool_size: Maximum number of pooled connections to the server
+        recv_buffer_size: Socket receive buffer size in bytes, 0 for the OS default
+
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    session.auth = (username, password)
+
+    # All requests go to the same host, so one pool is enough. Retries are
+    # handled by the callers, so the adapter itself must not retry.
+    adapter = SocketTunedAdapter(
+        recv_buffer_size,
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        max_retries=0,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Data class to store file information."""
 
@@ -141,22 +262,107 @@ class FileInfo:
         return format_size(self.size)
 
 
+@dataclass(frozen=True, slots=True)
+class SyncSettings:
+    """Synchronization settings, read once from the configuration."""
+
+    url: str
+    username: str
+    password: str = field(repr=False)
+    local_dir: str
+    download_dir: str
+    listing_parser: str
+    max_retries: int
+    retry_delay: int
+    chunk_size: int
+    progress_update_interval: float
+    progress_tick_mask: int
+    max_workers: int
+    segments: int
+    segment_min_size: int
+    socket_recv_buffer: int
+    auto_confirm: bool
+    filter_enabled: bool
+    filter_pattern: str
+    filter_case_sensitive: bool
+    filter_anchored: bool
+
+    @classmethod
+    def from_config(cls, config: configparser.ConfigParser) -> "SyncSettings":
+        """
+        Read the settings from a configuration.
+
+        Options missing from the configuration take their value from
+        ConfigManager.DEFAULT_CONFIG.
+
+        Args:
+            config: ConfigParser object with configuration
+
+        Returns:
+            SyncSettings with the parsed values
+        """
+        # Flatten the configuration once into plain dictionaries over the defaults
+        flat = {
+            section: {**defaults, **(config[section] if section in config else {})}
+            for section, defaults in ConfigManager.DEFAULT_CONFIG.items()
+        }
+        server = flat["SERVER"]
+        local = flat["LOCAL"]
+        download = flat["DOWNLOAD"]
+        filter_settings = flat["FILTER"]
+
+        return cls(
+            url=server["url"],
+            username=server["username"],
+            password=server["password"],
+            local_dir=local["local_dir"],
+            download_dir=local["download_dir"],
+            listing_parser=server["listing_parser"],
+            max_retries=int(download["max_retries"]),
+            retry_delay=int(download["retry_delay"]),
+            chunk_size=int(download["chunk_size"]),
+            progress_update_interval=float(download["progress_update_interval"]),
+            progress_tick_mask=int(download["progress_tick_mask"]),
+            max_workers=max(1, int(download["max_workers"])),
+            segments=max(1, int(download["segments"])),
+            segment_min_size=int(download["segment_min_size"]),
+            socket_recv_buffer=int(download["socket_recv_buffer"]),
+            auto_confirm=_parse_bool(download["auto_confirm"]),
+            filter_enabled=_parse_bool(filter_settings["enabled"]),
+            filter_pattern=filter_settings["pattern"],
+            filter_case_sensitive=_parse_bool(filter_settings["case_sensitive"]),
+            filter_anchored=_parse_bool(filter_settings["anchored"]),
+        )
+
+
 class ConfigManager:
     """Class to manage configuration loading and saving."""
 
     DEFAULT_CONFIG = {
-        "SERVER": {"url": "", "username": "", "password": ""},
+        "SERVER": {
+            "url": "",
+            "username": "",
+            "password": "",
+            "listing_parser": "regex",
+        },
         "LOCAL": {"local_dir": "current_files", "download_dir": "new_downloads"},
         "DOWNLOAD": {
             "max_retries": "3",
             "retry_delay": "5",
-            "chunk_size": "8192",
+            "chunk_size": "1048576",
             "progress_update_interval": "1",
+            "progress_tick_mask": "0",
+            "max_workers": "4",
+            "segments": "4",
+            "segment_min_size": "67108864",
+            "socket_recv_buffer": "0",
+            "auto_confirm": "false",
         },
         "FILTER": {
             "enabled": "false",  # Disabled by default - will not download anything
             "pattern": ".*",  # Default to match everything when enabled
             "case_sensitive": "false",
+            "anchored": "false",  # Pattern must match the whole filename
             "description": "Regular expression to filter filenames. Only files matching this pattern will be downloaded. If disabled, no files will be downloaded.",
         },
     }
@@ -379,25 +585,37 @@ class ProgressBar:
 
     PROGRESS_BAR_CHARACTER = "█"
 
-    def __init__(self, bar_width: int = 100, update_interval: float = 1.0):
+    def __init__(
+        self, bar_width: int = 100, update_interval: float = 1.0, tick_mask: int = 0
+    ):
         """
         Initialize the progress bar.
 
         Args:
             bar_width: Width of the progress bar in characters
             update_interval: Minimum time between updates in seconds
+            tick_mask: Only check the clock on updates where the update count
+                has none of these bits set; use one less than a power of two
         """
         self.bar_width = bar_width
         self.update_interval = update_interval
         self.last_update_time = 0
         self.start_time = 0
 
+        # Update counter used to skip most clock reads
+        self._tick = 0
+        self._tick_mask = tick_mask
+
+        # Prebuilt bar segments, sliced on each refresh
+        self._full_bar = self.PROGRESS_BAR_CHARACTER * bar_width
+        self._blank_bar = " " * bar_width
+
     def start(self) -> None:
         """Start the progress timer."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.last_update_time = self.start_time
 
-    def update(self, current: int, total: int, filename: str) -> None:
+    def update(self, current: int, total: int, filename: str, total_str: str) -> None:
         """
         Update the progress bar if the update interval has elapsed.
 
@@ -405,13 +623,18 @@ class ProgressBar:
             current: Current progress value
             total: Total value for 100% completion
             filename: Name of the file being processed
+            total_str: Total value formatted with format_size
         """
-        current_time = time.time()
+        self._tick += 1
+        if self._tick & self._tick_mask:
+            return
+
+        current_time = time.monotonic()
         if current_time - self.last_update_time >= self.update_interval:
-            self._display(current, total, filename)
+            self._display(current, total, filename, total_str)
             self.last_update_time = current_time
 
-    def _display(self, current: int, total: int, filename: str) -> None:
+    def _display(self, current: int, total: int, filename: str, total_str: str) -> None:
         """
         Display the progress bar.
 
@@ -419,12 +642,13 @@ class ProgressBar:
             current: Current progress value
             total: Total value for 100% completion
             filename: Name of the file being processed
+            total_str: Total value formatted with format_size
         """
         if total <= 0:
             return
 
         percent = min(100.0, current / total * 100)
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = time.monotonic() - self.start_time
 
         # Calculate speed and ETA
         if elapsed_time > 0:
@@ -449,19 +673,20 @@ class ProgressBar:
 
         bar = (
             color
-            + self.PROGRESS_BAR_CHARACTER * filled_width
+            + self._full_bar[:filled_width]
             + Colors.RESET
-            + " " * (self.bar_width - filled_width)
+            + self._blank_bar[filled_width:]
         )
 
         # Format progress line
         progress_bar = f" [ {bar} ] {color}{percent:5.1f} % {Colors.RESET}"
-        info_line = f"{Colors.CYAN}{filename}{Colors.RESET}: {format_size(current)}/{format_size(total)} ({speed_str}) ETA: {eta_str}" + " "*10
+        info_line = f"{Colors.CYAN}{filename}{Colors.RESET}: {format_size(current)}/{total_str} ({speed_str}) ETA: {eta_str}" + " "*10
 
         # Update the console
-        sys.stdout.write(f"\r{progress_bar}\n{info_line}")
-        sys.stdout.write("\033[F")  # Move cursor up one line
-        sys.stdout.flush()
+        with console_lock:
+            sys.stdout.write(f"\r{progress_bar}\n{info_line}")
+            sys.stdout.write("\033[F")  # Move cursor up one line
+            sys.stdout.flush()
 
     def finish(self, success: bool = True) -> None:
         """
@@ -470,10 +695,13 @@ class ProgressBar:
         Args:
             success: Whether the operation completed successfully
         """
-        if success:
-            print(f"\n{Colors.GREEN}Download completed successfully{Colors.RESET}\n")
-        else:
-            print(f"\n{Colors.YELLOW}Download interrupted{Colors.RESET}\n")
+        with console_lock:
+            if success:
+                print(
+                    f"\n{Colors.GREEN}Download completed successfully{Colors.RESET}\n"
+                )
+            else:
+                print(f"\n{Colors.YELLOW}Download interrupted{Colors.RESET}\n")
 
 
 class ServerParser:
@@ -486,6 +714,8 @@ class ServerParser:
         password: str,
         max_retries: int = 3,
         retry_delay: int = 5,
+        session: Optional[requests.Session] = None,
+        listing_parser: str = "regex",
     ):
         """
         Initialize the ServerParser.
@@ -496,103 +726,255 @@ class ServerParser:
             password: Authentication password
             max_retries: Maximum number of retry attempts on connection failure
             retry_delay: Delay between retries in seconds
+            session: Shared HTTP session (a private one is created if omitted)
+            listing_parser: 'regex' to scan Apache-style listings with a regular
+                expression, or 'html' to always use an HTML parser
         """
         self.url = url
         self.username = username
         self.password = password
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.listing_parser = listing_parser
+
+        # Reuse connections across requests
+        self._owns_session = session is None
+        self.session = session or create_session(username, password)
 
-    def get_files(self, file_extension: str = ".laz") -> List[FileInfo]:
+    def close(self) -> None:
+        """Close the HTTP session if it was created by this parser."""
+        if self._owns_session:
+            self.session.close()
+
+    def get_files(
+        self,
+        file_extension: str = ".laz",
+        filter_match: Optional[Callable[[str], Any]] = None,
+        max_rejected: Optional[int] = None,
+    ) -> Tuple[List[FileInfo], List[str], int]:
         """
         Connect to server and parse the directory to get file information.
 
+        Rows rejected by the extension or filter are skipped before their size
+        and date cells are read.
+
         Args:
             file_extension: File extension to filter by
+            filter_match: Optional predicate; files for which it returns a falsy
+                value are skipped
+            max_rejected: Maximum number of skipped names to return, the count
+                always covers every skipped file
 
         Returns:
-            List of FileInfo objects
+            Tuple of (files, rejected_names, rejected_count) where rejected_names
+            lists the first files skipped by filter_match
         """
+        ext = file_extension.lower()
+        rejected = []
+        rejected_count = 0
+
+        def accept(filename: str) -> bool:
+            nonlocal rejected_count
+
+            # Only process files with the specified extension
+            if ext and not filename.lower().endswith(ext):
+                return False
+
+            if filter_match is not None and not filter_match(filename):
+                rejected_count += 1
+                if max_rejected is None or len(rejected) < max_rejected:
+                    rejected.append(filename)
+                return False
+
+            return True
+
         for attempt in range(self.max_retries):
-            if terminate_requested:
+            if TERMINATE.is_set():
                 logger.warning("Termination requested during server connection")
-                return []
+                return [], [], 0
+
+            # Start over if a previous attempt failed part way through
+            rejected.clear()
+            rejected_count = 0
 
             try:
-                response = requests.get(self.url, auth=(self.username, self.password))
-                response.raise_for_status()
+                # Stream the listing into lxml when it will be used
+                use_regex = self.listing_parser == "regex"
+                stream = etree is not None and not use_regex
+                with self.session.get(self.url, stream=stream) as response:
+                    response.raise_for_status()
+
+                    # Fall back to an HTML parser if the listing isn't Apache-style
+                    text = response.text if use_regex else ""
+                    if use_regex and _ROW_RE.search(text):
+                        rows = self._iter_rows_regex(text, accept)
+                    elif etree is not None:
+                        rows = self._iter_rows_lxml(response, accept)
+                    else:
+                        rows = self._iter_rows_soup(response, accept)
+
+                    # Rows rejected by the filter never reach this loop
+                    files = []
+                    append = files.append
+                    base_url = self.url
+                    parse_size = self._parse_size
+                    terminated = TERMINATE.is_set
+
+                    for filename, date_text, size_text in rows:
+                        if terminated():
+                            logger.warning("Termination requested during HTML parsing")
+                            break
+
+                        append(
+                            FileInfo(
+                                filename,
+                                base_url + filename,
+                                parse_size(size_text),
+                                date_text,
+                            )
+                        )
 
-                # Parse the HTML
-                soup = BeautifulSoup(response.text, "html.parser")
+                return files, rejected, rejected_count
 
-                files = []
+            except requests.exceptions.RequestException as e:
+                if TERMINATE.is_set() or attempt >= self.max_retries - 1:
+                    logger.error(
+                        "Error connecting to server after %d attempts: %s",
+                        attempt + 1,
+                        e,
+                    )
+                    return [], [], 0
 
-                # Find the table in the Apache directory listing
-                table = soup.find("table")
-                if not table:
-                    logger.error("Could not find the file listing table in the HTML")
-                    return []
+                logger.warning(
+                    "Error connecting to server (attempt %d/%s): %s",
+                    attempt + 1,
+                    self.max_retries,
+                    e,
+                )
+                logger.info("Retrying in %s seconds...", self.retry_delay)
+                time.sleep(self.retry_delay)
 
-                # Process each row in the table
-                for row in table.find_all("tr"):
-                    if terminate_requested:
-                        logger.warning("Termination requested during HTML parsing")
-                        return files
+        return [], [], 0
 
-                    # Get all cells in the row
-                    cells = row.find_all("td")
+    @staticmethod
+    def _iter_rows_regex(
+        text: str, accept: Callable[[str], bool]
+    ) -> Iterator[Tuple[str, str, str]]:
+        """
+        Extract file rows from an Apache-style listing without building a tree.
 
-                    # Skip rows that don't have enough cells (headers, etc.)
-                    if len(cells) < 4:
-                        continue
+        Args:
+            text: HTML of the directory listing
+            accept: Predicate deciding whether a filename should be returned
 
-                    # Get file name cell (second cell) and check if it contains a link
-                    name_cell = cells[1]
-                    link = name_cell.find("a")
+        Yields:
+            Tuples of (filename, last_modified, size_text)
+        """
+        for match in _ROW_RE.finditer(text):
+            filename, date_text, size_text = match.groups()
+            if "&" in filename:
+                filename = html.unescape(filename)
 
-                    if not link:
-                        continue
+            if accept(filename):
+                yield filename, date_text.strip(), size_text.strip()
 
-                    filename = link.get("href")
+    @staticmethod
+    def _iter_rows_soup(
+        response: requests.Response, accept: Callable[[str], bool]
+    ) -> Iterator[Tuple[str, str, str]]:
+        """
+        Extract file rows from the directory listing using BeautifulSoup.
 
-                    # Only process files with the specified extension
-                    if file_extension and not filename.lower().endswith(
-                        file_extension.lower()
-                    ):
-                        continue
+        Args:
+            response: Response containing the directory listing
+            accept: Predicate deciding whether a filename should be returned
 
-                    # Get size from the fourth cell
-                    size_cell = cells[3]
-                    size_text = size_cell.get_text(strip=True)
-                    size_bytes = self._parse_size(size_text)
-
-                    # Get last modified date from third cell
-                    date_cell = cells[2]
-                    date_text = date_cell.get_text(strip=True)
-
-                    files.append(
-                        FileInfo(
-                            name=filename,
-                            url=self.url + filename,
-                            size=size_bytes,
-                            last_modified=date_text,
-                        )
-                    )
+        Yields:
+            Tuples of (filename, last_modified, size_text)
+        """
+        # Parse the HTML
+        soup = BeautifulSoup(response.text, "html.parser")
+
+        # Find the table in the Apache directory listing
+        table = soup.find("table")
+        if not table:
+            logger.error("Could not find the file listing table in the HTML")
+            return
 
-                return files
+        # Process each row in the table
+        for row in table.find_all("tr"):
+            # Get all cells in the row
+            cells = row.find_all("td")
 
-            except requests.exceptions.RequestException as e:
-                if terminate_requested or attempt >= self.max_retries - 1:
-                    logger.error(
-                        f"Error connecting to server after {attempt+1} attempts: {e}"
+            # Skip rows that don't have enough cells (headers, etc.)
+            if len(cells) < 4:
+                continue
+
+            # Get file name cell (second cell) and check if it contains a link
+            link = cells[1].find("a")
+            if not link:
+                continue
+
+            filename = link.get("href")
+            if not accept(filename):
+                continue
+
+            # Last modified date is in the third cell, size in the fourth
+            yield filename, cells[2].get_text(strip=True), cells[3].get_text(strip=True)
+
+    @staticmethod
+    def _iter_rows_lxml(
+        response: requests.Response, accept: Callable[[str], bool]
+    ) -> Iterator[Tuple[str, str, str]]:
+        """
+        Extract file rows from the directory listing as it is downloaded.
+
+        Rows are parsed with lxml while the response streams in and are
+        discarded once processed, so the full document tree is never held.
+
+        Args:
+            response: Streamed response containing the directory listing
+            accept: Predicate deciding whether a filename should be returned
+
+        Yields:
+            Tuples of (filename, last_modified, size_text)
+        """
+        parser = etree.HTMLPullParser(events=("end",), tag="tr")
+        chunks = response.iter_content(chunk_size=64 * 1024)
+        found_rows = False
+
+        while True:
+            data = next(chunks, None)
+            if data is None:
+                parser.close()
+            else:
+                parser.feed(data)
+
+            for _, row in parser.read_events():
+                found_rows = True
+                cells = row.findall("td")
+
+                # Skip rows without enough cells or without a link in the name cell
+                link = cells[1].find(".//a") if len(cells) >= 4 else None
+                filename = link.get("href") if link is not None else None
+
+                if filename and accept(filename):
+                    yield (
+                        filename,
+                        "".join(cells[2].itertext()).strip(),
+                        "".join(cells[3].itertext()).strip(),
                     )
-                    return []
 
-                logger.warning(
-                    f"Error connecting to server (attempt {attempt+1}/{self.max_retries}): {e}"
-                )
-                logger.info(f"Retrying in {self.retry_delay} seconds...")
-                time.sleep(self.retry_delay)
+                # Drop the processed row and any earlier siblings
+                row.clear()
+                while row.getprevious() is not None:
+                    del row.getparent()[0]
+
+            if data is None:
+                break
+
+        if not found_rows:
+            logger.error("Could not find the file listing table in the HTML")
 
     @staticmethod
     def _parse_size(size_str: str) -> int:
@@ -609,37 +991,36 @@ class ServerParser:
             return 0
 
         # Extract number and unit
-        match = re.match(r"(\d+(?:\.\d+)?)(K|M|G|T)?", size_str)
+        match = _SIZE_RE.match(size_str)
         if not match:
             return 0
 
-        size_num = float(match.group(1))
-        size_unit = match.group(2) if match.group(2) else ""
+        size_num, size_unit = match.groups("")
 
         # Convert to bytes
-        if size_unit == "K":
-            return int(size_num * 1024)
-        elif size_unit == "M":
-            return int(size_num * 1024 * 1024)
-        elif size_unit == "G":
-            return int(size_num * 1024 * 1024 * 1024)
-        elif size_unit == "T":
-            return int(size_num * 1024 * 1024 * 1024 * 1024)
-        else:
-            return int(size_num)
+        return int(float(size_num) * _UNIT_MUL[size_unit])
 
 
 class Downloader:
-    """Class to handle file downloading with resume capability."""
+    """
+    Class to handle file downloading with resume capability.
+
+    A single Downloader may be used from several threads at once; all
+    per-download state lives in locals of the download call.
+    """
 
     def __init__(
         self,
         username: str,
         password: str,
-        chunk_size: int = 8192,
+        chunk_size: int = 1024 * 1024,
         max_retries: int = 3,
         retry_delay: int = 5,
         progress_update_interval: float = 1.0,
+        session: Optional[requests.Session] = None,
+        progress_tick_mask: int = 0,
+        segments: int = 4,
+        segment_min_size: int = 64 * 1024 * 1024,
     ):
         """
         Initialize the Downloader.
@@ -647,30 +1028,42 @@ class Downloader:
         Args:
             username: Authentication username
             password: Authentication password
-            chunk_size: Download chunk size in bytes
+            chunk_size: Download chunk size in bytes, raised to at least 64 KiB
+                and rounded up to a multiple of 4096
             max_retries: Maximum number of retry attempts on download failure
             retry_delay: Delay between retries in seconds
             progress_update_interval: Interval for progress updates in seconds
+            session: Shared HTTP session (a private one is created if omitted)
+            progress_tick_mask: Chunk-count mask limiting progress clock reads
+            segments: Number of parallel byte ranges used for large files
+            segment_min_size: Minimum file size in bytes for a segmented download
         """
         self.username = username
         self.password = password
-        self.chunk_size = chunk_size
+        chunk_size = max(chunk_size, _MIN_CHUNK_SIZE)
+        self.chunk_size = -(-chunk_size // _PAGE_SIZE) * _PAGE_SIZE
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.progress_bar = ProgressBar(update_interval=progress_update_interval)
+        self.progress_update_interval = progress_update_interval
+        self.progress_tick_mask = progress_tick_mask
+        self.segments = segments
+        self.segment_min_size = segment_min_size
 
-        # Track download state
-        self.current_file = None
-        self.current_size = 0
-        self.total_size = 0
+        # Reuse connections across downloads
+        self._owns_session = session is None
+        self.session = session or create_session(username, password)
 
-    def download(self, file_info: FileInfo, local_path: str) -> Tuple[bool, int]:
+    def download(
+        self, file_info: FileInfo, local_path: str, local_size: Optional[int] = None
+    ) -> Tuple[bool, int]:
         """
         Download a file with progress tracking and resumption capability.
 
         Args:
             file_info: FileInfo object with file details
             local_path: Path where the file should be saved
+            local_size: Size of the existing local file if already known, 0 if
+                it doesn't exist
 
         Returns:
             Tuple of (success_status, bytes_downloaded)
@@ -679,23 +1072,52 @@ class Downloader:
         os.makedirs(os.path.dirname(local_path), exist_ok=True)
 
         # Check if the file exists and its size
-        file_exists = os.path.exists(local_path)
-        downloaded_size = os.path.getsize(local_path) if file_exists else 0
-
-        # Set current file info for tracking
-        self.current_file = file_info.name
-        self.current_size = downloaded_size
-        self.total_size = file_info.size
+        downloaded_size = local_size
+        if downloaded_size is None:
+            try:
+                downloaded_size = os.path.getsize(local_path)
+            except OSError:
+                downloaded_size = 0
+
+        # Nothing to fetch if the listing says the local copy is already complete
+        if file_info.size > 0 and downloaded_size >= file_info.size:
+            logger.info("%s is already fully downloaded", file_info.name)
+            return True, 0
+
+        # Fetch large new files over several connections if the server allows it
+        if (
+            self.segments > 1
+            and downloaded_size == 0
+            and file_info.size >= self.segment_min_size
+        ):
+            result = self._download_ranged(file_info, local_path, self.segments)
+            if result is not None:
+                return result
 
         # Start download
-        success, bytes_downloaded = self._download_with_retries(
+        return self._download_with_retries(
             file_info, local_path, start_position=downloaded_size
         )
 
-        # Reset tracking after download completes
-        self.current_file = None
+    def close(self) -> None:
+        """Close the HTTP session if it was created by this downloader."""
+        if self._owns_session:
+            self.session.close()
 
-        return success, bytes_downloaded
+    def _iter_body(self, response: requests.Response) -> Iterator[bytes]:
+        """
+        Iterate over the body of a streamed response in chunk_size pieces.
+
+        Args:
+            response: Streamed response to read
+
+        Returns:
+            Iterator of byte chunks
+        """
+        # Read straight from the connection, only decoding compressed bodies
+        return response.raw.stream(
+            self.chunk_size, decode_content="Content-Encoding" in response.headers
+        )
 
     def _download_with_retries(
         self, file_info: FileInfo, local_path: str, start_position: int = 0
@@ -712,174 +1134,474 @@ class Downloader:
             Tuple of (success_status, bytes_downloaded)
         """
         bytes_downloaded = 0
+        current_size = start_position
+        progress_bar = ProgressBar(
+            update_interval=self.progress_update_interval,
+            tick_mask=self.progress_tick_mask,
+        )
 
         for attempt in range(self.max_retries):
-            if terminate_requested:
+            if TERMINATE.is_set():
                 logger.warning(
-                    f"Termination requested before download attempt for {file_info.name}"
+                    "Termination requested before download attempt for %s",
+                    file_info.name,
                 )
-                self.progress_bar.finish(success=False)
+                progress_bar.finish(success=False)
                 return False, bytes_downloaded
 
             try:
                 # Set up headers for resuming download if needed
                 headers = {}
-                if start_position > 0:
-                    headers["Range"] = f"bytes={start_position}-"
-                    logger.info(f"Resuming download from byte {start_position}")
+                if current_size > 0:
+                    headers["Range"] = f"bytes={current_size}-"
+                    logger.info("Resuming download from byte %d", current_size)
 
                 # Open the request with authentication and possible range header
-                response = requests.get(
+                with self.session.get(
                     file_info.url,
-                    auth=(self.username, self.password),
                     headers=headers,
                     stream=True,
                     timeout=(10, 30),  # Connect timeout, read timeout
-                )
-
-                # If we're resuming and the server doesn't support range requests
-                if start_position > 0 and response.status_code != 206:
-                    logger.warning(
-                        "Server doesn't support range requests, starting from beginning"
-                    )
-                    return self._download_with_retries(file_info, local_path, 0)
-
-                response.raise_for_status()
-
-                # Get total size from Content-Length header or Content-Range if resuming
-                if response.status_code == 206:
-                    # For resumed downloads with Content-Range: bytes 1000-50000/50001
-                    content_range = response.headers.get("Content-Range", "")
-                    total_size_match = re.search(r"/(\d+)", content_range)
-                    total_size = (
-                        int(total_size_match.group(1)) if total_size_match else 0
-                    )
-                else:
-                    # For normal downloads
-                    total_size = (
-                        int(response.headers.get("content-length", 0)) + start_position
-                    )
-
-                # Open file in append mode if resuming, otherwise in write mode
-                mode = "ab" if start_position > 0 else "wb"
-
-                # Initialize progress bar
-                self.progress_bar.start()
-                current_size = start_position
-                bytes_downloaded = 0
-
-                # Download the file
-                with open(local_path, mode) as f:
-                    for chunk in response.iter_content(chunk_size=self.chunk_size):
-                        if terminate_requested:
-                            # Close file properly before exiting
-                            f.flush()
-                            f.close()
-                            logger.warning(
-                                f"Download of {file_info.name} interrupted at {format_size(current_size)}"
-                            )
-                            self.progress_bar.finish(success=False)
-
-                            # Return partial success with bytes downloaded
-                            return False, bytes_downloaded
-
-                        if chunk:
-                            f.write(chunk)
-                            chunk_size = len(chunk)
-                            current_size += chunk_size
-                            bytes_downloaded += chunk_size
-                            self.current_size = current_size
-                            self.progress_bar.update(
-                                current_size, total_size, os.path.basename(local_path)
-                            )
-
-                # Complete the progress display
-                self.progress_bar.finish(success=True)
+                ) as response:
+                    # If we're resuming and the server doesn't support range requests
+                    if current_size > 0 and response.status_code != 206:
+                        logger.warning(
+                            "Server doesn't support range requests, starting from beginning"
+                        )
+                        # Release the connection before downloading the file again
+                        response.close()
+                        return self._download_with_retries(file_info, local_path, 0)
+
+                    response.raise_for_status()
+
+                    # Get total size from Content-Length header or Content-Range if resuming
+                    if response.status_code == 206:
+                        # For resumed downloads with Content-Range: bytes 1000-50000/50001
+                        content_range = response.headers.get("Content-Range", "")
+                        total_size_match = _CONTENT_RANGE_RE.search(content_range)
+                        total_size = (
+                            int(total_size_match.group(1)) if total_size_match else 0
+                        )
+                    else:
+                        # For normal downloads
+                        total_size = (
+                            int(response.headers.get("content-length", 0))
+                            + current_size
+                        )
 
-                # Verify final file size matches expected size
-                final_size = os.path.getsize(local_path)
-                if total_size > 0 and final_size < total_size:
-                    logger.warning(
-                        f"Downloaded file size ({final_size}) is less than expected ({total_size})"
-                    )
-                    return False, bytes_downloaded
+                    # Open file in append mode if resuming, otherwise in write mode
+                    mode = "ab" if current_size > 0 else "wb"
+
+                    # Initialize progress bar
+                    progress_bar.start()
+                    basename = os.path.basename(local_path)
+                    total_size_str = format_size(total_size)
+
+                    # Download the file
+                    terminated = TERMINATE.is_set
+                    pb_update = progress_bar.update
+                    with open(local_path, mode, buffering=_WRITE_BUFFER_SIZE) as f:
+                        for chunk in self._iter_body(response):
+                            if terminated():
+                                # Close file properly before exiting
+                                f.flush()
+                                f.close()
+                                logger.warning(
+                                    "Download of %s interrupted at %s",
+                                    file_info.name,
+                                    format_size(current_size),
+                                )
+                                progress_bar.finish(success=False)
+
+                                # Return partial success with bytes downloaded
+                                return False, bytes_downloaded
+
+                            if chunk:
+                                f.write(chunk)
+                                chunk_size = len(chunk)
+                                current_size += chunk_size
+                                bytes_downloaded += chunk_size
+                                pb_update(
+                                    current_size, total_size, basename, total_size_str
+                                )
+
+                    # Complete the progress display
+                    progress_bar.finish(success=True)
+
+                    # Verify final file size matches expected size
+                    final_size = current_size
+                    if total_size > 0 and final_size < total_size:
+                        logger.warning(
+                            "Downloaded file size (%d) is less than expected (%d)",
+                            final_size,
+                            total_size,
+                        )
+                        return False, bytes_downloaded
 
-                return True, bytes_downloaded
+                    return True, bytes_downloaded
 
-            except requests.exceptions.RequestException as e:
-                if terminate_requested:
+            except _TRANSFER_ERRORS as e:
+                if TERMINATE.is_set():
                     logger.warning(
-                        f"Termination requested during download error handling for {file_info.name}"
+                        "Termination requested during download error handling for %s",
+                        file_info.name,
                     )
                     return False, bytes_downloaded
 
-                current_size = (
-                    os.path.getsize(local_path) if os.path.exists(local_path) else 0
-                )
-
                 if attempt < self.max_retries - 1:
                     logger.warning(
-                        f"Download error (attempt {attempt+1}/{self.max_retries}): {e}"
+                        "Download error (attempt %d/%s): %s",
+                        attempt + 1,
+                        self.max_retries,
+                        e,
                     )
                     logger.info(
-                        f"Retrying in {self.retry_delay} seconds from byte {current_size}..."
+                        "Retrying in %s seconds from byte %d...",
+                        self.retry_delay,
+                        current_size,
                     )
                     time.sleep(self.retry_delay)
                 else:
                     logger.error(
-                        f"Download failed after {self.max_retries} attempts: {e}"
+                        "Download failed after %s attempts: %s", self.max_retries, e
                     )
                     return False, bytes_downloaded
 
         return False, bytes_downloaded
 
+    def _download_ranged(
+        self, file_info: FileInfo, local_path: str, n_parts: int
+    ) -> Optional[Tuple[bool, int]]:
+        """
+        Download a file as several byte ranges fetched in parallel.
+
+        The ranges are written into a preallocated temporary file that is
+        renamed to local_path once every range is complete. The ranges still
+        missing are recorded next to an incomplete temporary file, so the next
+        run resumes them.
+
+        Args:
+            file_info: FileInfo object with file details
+            local_path: Path where the file should be saved
+            n_parts: Number of byte ranges to fetch in parallel
+
+        Returns:
+            Tuple of (success_status, bytes_downloaded), or None if the server
+            does not support range requests
+        """
+        # Probe for range support and the exact file size
+        try:
+            with self.session.get(
+                file_info.url,
+                headers={"Range": "bytes=0-0"},
+                stream=True,
+                timeout=(10, 30),
+            ) as response:
+                if response.status_code != 206:
+                    return None
+                content_range = response.headers.get("Content-Range", "")
+        except requests.exceptions.RequestException as e:
+            logger.warning("Range probe failed for %s: %s", file_info.name, e)
+            return None
+
+        total_size_match = _CONTENT_RANGE_RE.search(content_range)
+        total_size = int(total_size_match.group(1)) if total_size_match else 0
+        if total_size < n_parts:
+            return None
+
+        part_path = local_path + ".part"
+        state_path = part_path + ".ranges"
+
+        # Resume the missing ranges of an earlier attempt if there is one
+        ranges = self._load_range_state(part_path, state_path, total_size)
+        if ranges is None:
+            # Preallocate the output so each range can be written in place
+            with open(part_path, "wb") as f:
+                f.truncate(total_size)
+
+            part_size = -(-total_size // n_parts)  # Ceiling division
+            ranges = [
+                (start, min(start + part_size, total_size) - 1)
+                for start in range(0, total_size, part_size)
+            ]
+        else:
+            logger.info("Resuming segmented download of %s", file_info.name)
+
+        # Record the ranges up front so even a hard kill leaves a resumable file
+        self._save_range_state(state_path, total_size, ranges)
+        already_done = total_size - sum(end - start + 1 for start, end in ranges)
+
+        progress_bar = ProgressBar(
+            update_interval=self.progress_update_interval,
+            tick_mask=self.progress_tick_mask,
+        )
+        progress_bar.start()
+        progress = {"current": already_done}
+        progress_lock = threading.Lock()
+        basename = os.path.basename(local_path)
+        total_size_str = format_size(total_size)
+        pb_update = progress_bar.update
+
+        def on_chunk(chunk_size: int) -> None:
+            with progress_lock:
+                progress["current"] += chunk_size
+                current_size = progress["current"]
+            pb_update(current_size, total_size, basename, total_size_str)
+
+        logger.info("Downloading %s in %d parallel ranges", file_info.name, len(ranges))
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            positions = list(
+                executor.map(
+                    lambda r: self._fetch_range(file_info, part_path, *r, on_chunk),
+                    ranges,
+                )
+            )
+
+        # Ranges that didn't reach their end are left for the next run
+        remaining = [
+            (position, end)
+            for position, (_, end) in zip(positions, ranges)
+            if position <= end
+        ]
+        bytes_downloaded = sum(
+            position - start for position, (start, _) in zip(positions, ranges)
+        )
+
+        if not remaining:
+            os.replace(part_path, local_path)
+            os.remove(state_path)
+            progress_bar.finish(success=True)
+            return True, bytes_downloaded
+
+        self._save_range_state(state_path, total_size, remaining)
+        progress_bar.finish(success=False)
+        if not TERMINATE.is_set():
+            logger.error("Segmented download of %s failed", file_info.name)
+        return False, bytes_downloaded
+
+    @staticmethod
+    def _load_range_state(
+        part_path: str, state_path: str, total_size: int
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Load the missing ranges of an interrupted segmented download.
+
+        Args:
+            part_path: Temporary file the ranges are written into
+            state_path: File listing the missing ranges
+            total_size: Current size of the file on the server
+
+        Returns:
+            List of (start, end) ranges still to fetch, or None if there is no
+            usable earlier attempt
+        """
+        try:
+            if os.path.getsize(part_path) != total_size:
+                return None
+            with open(state_path) as f:
+                lines = f.read().split()
+        except OSError:
+            return None
+
+        # The first value is the file size, followed by start/end pairs
+        try:
+            values = [int(value) for value in lines]
+        except ValueError:
+            return None
+        if not values or values[0] != total_size or len(values) % 2 != 1:
+            return None
+
+        ranges = list(zip(values[1::2], values[2::2]))
+        if not ranges or any(
+            not 0 <= start <= end < total_size for start, end in ranges
+        ):
+            return None
+        return ranges
+
+    @staticmethod
+    def _save_range_state(
+        state_path: str, total_size: int, ranges: List[Tuple[int, int]]
+    ) -> None:
+        """
+        Record the ranges of a segmented download that are still missing.
+
+        Args:
+            state_path: File listing the missing ranges
+            total_size: Size of the file on the server
+            ranges: List of (start, end) ranges still to fetch
+        """
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(f"{total_size}\n")
+            f.writelines(f"{start} {end}\n" for start, end in ranges)
+        os.replace(tmp_path, state_path)
+
+    def _fetch_range(
+        self,
+        file_info: FileInfo,
+        part_path: str,
+        start: int,
+        end: int,
+        on_chunk: Callable[[int], None],
+    ) -> int:
+        """
+        Fetch one byte range of a file into its slice of the output file.
+
+        Args:
+            file_info: FileInfo object with file details
+            part_path: Preallocated file to write the range into
+            start: First byte of the range
+            end: Last byte of the range (inclusive)
+            on_chunk: Callback receiving the size of every chunk written
+
+        Returns:
+            Position of the first byte not yet written, end + 1 if the whole
+            range was written
+        """
+        position = start
+
+        for attempt in range(self.max_retries):
+            if TERMINATE.is_set():
+                return position
+
+            # Buffered bytes can't be trusted if writing the file fails
+            attempt_start = position
+
+            try:
+                with self.session.get(
+                    file_info.url,
+                    headers={"Range": f"bytes={position}-{end}"},
+                    stream=True,
+                    timeout=(10, 30),
+                ) as response:
+                    if response.status_code != 206:
+                        raise requests.exceptions.HTTPError(
+                            f"Unexpected status {response.status_code} for range request",
+                            response=response,
+                        )
+
+                    terminated = TERMINATE.is_set
+                    with open(part_path, "r+b", buffering=_WRITE_BUFFER_SIZE) as f:
+                        f.seek(position)
+                        for chunk in self._iter_body(response):
+                            if terminated():
+                                break
+                            if chunk:
+                                f.write(chunk)
+                                position += len(chunk)
+                                on_chunk(len(chunk))
+
+                if position > end or terminated():
+                    return position
+
+                raise requests.exceptions.ConnectionError(
+                    f"Range ended early at byte {position} of {end + 1}"
+                )
+
+            except _TRANSFER_ERRORS as e:
+                if TERMINATE.is_set() or attempt >= self.max_retries - 1:
+                    logger.error(
+                        "Range %d-%d of %s failed after %d attempts: %s",
+                        start,
+                        end,
+                        file_info.name,
+                        attempt + 1,
+                        e,
+                    )
+                    return position
+
+                logger.warning(
+                    "Range %d-%d of %s failed (attempt %d/%s): %s",
+                    start,
+                    end,
+                    file_info.name,
+                    attempt + 1,
+                    self.max_retries,
+                    e,
+                )
+                time.sleep(self.retry_delay)
+
+            except OSError as e:
+                # Local file errors won't go away by retrying
+                logger.error(
+                    "Cannot write range %d-%d of %s: %s", start, end, file_info.name, e
+                )
+                return attempt_start
+
+        return position
+
 
 class FileSynchronizer:
     """Main class to synchronize files from server to local directories."""
 
-    def __init__(self, config: configparser.ConfigParser):
+    def __init__(self, config: configparser.ConfigParser, auto_confirm: bool = False):
         """
         Initialize the FileSynchronizer.
 
         Args:
             config: ConfigParser object with configuration
+            auto_confirm: Start downloads without asking for confirmation
         """
         self.config = config
-        self.url = config["SERVER"]["url"]
-        self.username = config["SERVER"]["username"]
-        self.password = config["SERVER"]["password"]
-        self.local_dir = config["LOCAL"]["local_dir"]
-        self.download_dir = config["LOCAL"]["download_dir"]
-
-        # Load download settings
-        self.max_retries = int(config["DOWNLOAD"].get("max_retries", 3))
-        self.retry_delay = int(config["DOWNLOAD"].get("retry_delay", 5))
-        self.chunk_size = int(config["DOWNLOAD"].get("chunk_size", 8192))
-        self.progress_update_interval = float(
-            config["DOWNLOAD"].get("progress_update_interval", 1)
+
+        # Read the configuration once
+        settings = SyncSettings.from_config(config)
+        if auto_confirm:
+            settings = replace(settings, auto_confirm=True)
+        self.settings = settings
+
+        self.abs_download_dir = os.path.abspath(settings.download_dir)
+
+        # Download paths are built by appending the file name to this prefix
+        self._download_prefix = os.path.join(settings.download_dir, "")
+
+        # Share one connection pool between the listing and the downloads
+        self.session = create_session(
+            settings.username,
+            settings.password,
+            pool_size=settings.max_workers * settings.segments,
+            recv_buffer_size=settings.socket_recv_buffer,
         )
 
         # Initialize components
         self.server_parser = ServerParser(
-            self.url, self.username, self.password, self.max_retries, self.retry_delay
+            settings.url,
+            settings.username,
+            settings.password,
+            settings.max_retries,
+            settings.retry_delay,
+            session=self.session,
+            listing_parser=settings.listing_parser,
         )
 
         self.downloader = Downloader(
-            self.username,
-            self.password,
-            self.chunk_size,
-            self.max_retries,
-            self.retry_delay,
-            self.progress_update_interval,
+            settings.username,
+            settings.password,
+            settings.chunk_size,
+            settings.max_retries,
+            settings.retry_delay,
+            settings.progress_update_interval,
+            session=self.session,
+            progress_tick_mask=settings.progress_tick_mask,
+            segments=settings.segments,
+            segment_min_size=settings.segment_min_size,
         )
 
         # Track synchronization state
         self.download_start_time = 0
         self.downloaded_files = []
         self.failed_files = []
-        self.filtered_files = []  # Track files excluded by regex filter
+        self.filtered_files = []  # First few files excluded by regex filter
+        self.filtered_count = 0
         self.total_bytes_downloaded = 0
 
+        # Compile the filename filter
+        self._filter_signature = None
+        self._filter_re = None
+        self._filter_match = None
+        self._compile_filter()
+
     def sync(self, file_extension: str = "") -> bool:
         """
         Synchronize files from server to local directories.
@@ -891,32 +1613,39 @@ class FileSynchronizer:
             True if sync was successful, False otherwise
         """
         # Create directories if they don't exist
-        os.makedirs(self.local_dir, exist_ok=True)
-        os.makedirs(self.download_dir, exist_ok=True)
+        os.makedirs(self.settings.local_dir, exist_ok=True)
+        os.makedirs(self.settings.download_dir, exist_ok=True)
 
         # Reset state
         self.downloaded_files = []
         self.failed_files = []
         self.filtered_files = []
+        self.filtered_count = 0
         self.total_bytes_downloaded = 0
 
-        # Check if filtering is enabled
-        filter_enabled = self.config.getboolean("FILTER", "enabled", fallback=False)
-
         # Alert user if filtering is disabled (no files will be downloaded)
-        if not filter_enabled:
+        if not self.settings.filter_enabled:
             message = (
                 f"\n{Colors.BG_YELLOW}{Colors.BOLD} WARNING: File filtering is disabled! {Colors.RESET}\n"
                 f"{Colors.YELLOW}No files will be downloaded unless you enable filtering.{Colors.RESET}\n"
                 f"{Colors.YELLOW}Enable filtering with --enable-filter or --filter options.{Colors.RESET}\n"
             )
             print(message)
-            user_response = input(
-                f"{Colors.BOLD}Do you want to enable filtering with pattern '.*' (all files)? (y/n): {Colors.RESET}"
-            )
+
+            # Never widen the filter without a human answering the prompt
+            if self.settings.auto_confirm:
+                user_response = "n"
+            else:
+                user_response = input(
+                    f"{Colors.BOLD}Do you want to enable filtering with pattern '.*' (all files)? (y/n): {Colors.RESET}"
+                )
             if user_response.lower() == "y":
                 self.config["FILTER"]["enabled"] = "true"
                 self.config["FILTER"]["pattern"] = ".*"
+                self.settings = replace(
+                    self.settings, filter_enabled=True, filter_pattern=".*"
+                )
+                self._compile_filter()
                 print(
                     f"{Colors.GREEN}Filtering enabled with pattern '.*' to download all files{Colors.RESET}"
                 )
@@ -924,229 +1653,246 @@ class FileSynchronizer:
                 logger.info("Filtering remains disabled. No files will be downloaded.")
                 return True
 
-        # Get server files
-        logger.info(f"Connecting to {self.url}...")
-        server_files = self.server_parser.get_files(file_extension)
+        if self._filter_match is None:
+            logger.warning(
+                "Regex filtering disabled due to invalid pattern. No files will be downloaded."
+            )
+            return True
+
+        # Get server files, applying the regex filter while the listing is parsed
+        logger.info("Connecting to %s...", self.settings.url)
+        server_files, self.filtered_files, self.filtered_count = (
+            self.server_parser.get_files(
+                file_extension,
+                self._filter_match,
+                max_rejected=_FILTERED_NAMES_SHOWN,
+            )
+        )
 
-        if terminate_requested:
+        if TERMINATE.is_set():
             logger.warning("Termination requested after server files listing")
             return False
 
+        pattern = self._filter_re.pattern
+        if self.filtered_count:
+            logger.info(
+                "Filtered out %d files using pattern: '%s'",
+                self.filtered_count,
+                pattern,
+            )
+
         if not server_files:
-            logger.error(f"Failed to get file list from server")
+            if self.filtered_count:
+                logger.info("No files on the server match the filter pattern!")
+                return True
+            logger.error("Failed to get file list from server")
             return False
 
-        logger.info(f"Found {len(server_files)} files on server")
+        logger.info(
+            "Found %d files on server matching '%s'", len(server_files), pattern
+        )
 
-        # Get list of local files from both directories
-        local_files = self._get_local_files(file_extension)
+        # Only names listed on the server matter from here on
+        server_names = {file.name for file in server_files}
 
         # Check for partial downloads in download_dir
-        partial_downloads = self._identify_partial_downloads(server_files)
+        dl_sizes = self._get_download_sizes(server_names)
+        partial_downloads = self._identify_partial_downloads(server_files, dl_sizes)
 
-        # Determine files to download
-        files_to_download = self._determine_files_to_download(
-            server_files, local_files, partial_downloads
-        )
+        # Get server files present in either local directory
+        local_files = self._get_local_files(server_names, dl_sizes)
 
-        # Apply regex filtering - this will filter files if filtering is enabled, otherwise return no files
-        files_to_download = self._apply_regex_filter(files_to_download)
+        # Determine files to download and the total download size
+        files_to_download, total_size = self._plan_downloads(
+            server_files, server_names, local_files, partial_downloads
+        )
 
-        if terminate_requested:
+        if TERMINATE.is_set():
             logger.warning("Termination requested after determining files to download")
             return False
 
         if not files_to_download:
-            if filter_enabled:
-                logger.info(
-                    f"All matching files are up to date or none match the filter pattern!"
-                )
-            else:
-                logger.info(f"Filtering is disabled. No files will be downloaded.")
+            logger.info("All matching files are up to date!")
             return True
 
-        # Calculate total download size
-        total_size = self._calculate_download_size(files_to_download, partial_downloads)
-
         # Show summary
         self._show_download_summary(files_to_download, partial_downloads, total_size)
 
-        if terminate_requested:
+        if TERMINATE.is_set():
             logger.warning("Termination requested after showing download summary")
             return False
 
         # Confirm download
-        confirmation = input(
-            f"{Colors.YELLOW}Continue with download? (y/n): {Colors.RESET}"
-        )
+        if self.settings.auto_confirm:
+            confirmation = "y"
+        else:
+            confirmation = input(
+                f"{Colors.YELLOW}Continue with download? (y/n): {Colors.RESET}"
+            )
         if confirmation.lower() != "y":
             logger.info("Download cancelled by user")
             return False
 
         # Download files
         self.download_start_time = time.time()
-        success = self._download_files(files_to_download, partial_downloads)
+        success = self._download_files(files_to_download, partial_downloads, dl_sizes)
 
         # Show final summary
         self._show_final_summary()
 
         # Return success only if all files downloaded and no termination was requested
-        return success and not terminate_requested
+        return success and not TERMINATE.is_set()
+
+    def close(self) -> None:
+        """Close the shared HTTP session."""
+        self.session.close()
+
+    def _compile_filter(self) -> None:
+        """
+        Compile the configured filter regex once for reuse on every filename.
+
+        The regex is only recompiled when the filter settings have changed.
+        Anchored patterns must match the whole filename, otherwise a match
+        anywhere in the name is enough. Leaves _filter_match set to None when
+        filtering is disabled or the pattern is invalid.
+        """
+        enabled = self.settings.filter_enabled
+        pattern = self.settings.filter_pattern
+        case_sensitive = self.settings.filter_case_sensitive
+        anchored = self.settings.filter_anchored
+
+        signature = (enabled, pattern, case_sensitive, anchored)
+        if signature == self._filter_signature:
+            return
+
+        self._filter_signature = signature
+        self._filter_re = None
+        self._filter_match = None
+
+        if not enabled:
+            return
 
-    def _get_local_files(self, file_extension: str) -> Set[str]:
+        try:
+            self._filter_re = re.compile(
+                pattern, 0 if case_sensitive else re.IGNORECASE
+            )
+        except re.error as e:
+            logger.error("Invalid regex pattern '%s': %s", pattern, e)
+            return
+
+        # fullmatch can give up as soon as the start of the name doesn't match
+        if anchored:
+            self._filter_match = self._filter_re.fullmatch
+        else:
+            self._filter_match = self._filter_re.search
+
+    def _get_local_files(
+        self, server_names: Set[str], dl_sizes: Dict[str, int]
+    ) -> Set[str]:
         """
-        Get set of existing local files.
+        Get set of server files that already exist locally.
 
         Args:
-            file_extension: File extension to filter by
+            server_names: Names of the files listed on the server
+            dl_sizes: Sizes of the server files found in the download directory
 
         Returns:
             Set of filenames
         """
-        local_files = set()
-
-        # Add files from local directory
-        for file in os.listdir(self.local_dir):
-            if not file_extension or file.lower().endswith(file_extension.lower()):
-                local_files.add(file)
+        # The download directory has already been scanned for dl_sizes
+        local_files = set(dl_sizes)
 
-        # Add files from download directory
-        for file in os.listdir(self.download_dir):
-            if not file_extension or file.lower().endswith(file_extension.lower()):
-                local_files.add(file)
+        # Names that aren't on the server are dropped as the directory is read
+        with os.scandir(self.settings.local_dir) as entries:
+            local_files.update(
+                filter(server_names.__contains__, (entry.name for entry in entries))
+            )
 
         return local_files
 
+    def _get_download_sizes(self, server_names: Set[str]) -> Dict[str, int]:
+        """
+        Get the sizes of server files already present in the download directory.
+
+        Args:
+            server_names: Names of the files listed on the server
+
+        Returns:
+            Dictionary mapping filenames to their local size in bytes
+        """
+        # Walk the download directory once and only stat server files
+        dl_sizes = {}
+        with os.scandir(self.settings.download_dir) as entries:
+            for entry in entries:
+                if entry.name in server_names:
+                    try:
+                        dl_sizes[entry.name] = entry.stat().st_size
+                    except OSError:
+                        continue
+
+        return dl_sizes
+
     def _identify_partial_downloads(
-        self, server_files: List[FileInfo]
+        self, server_files: List[FileInfo], dl_sizes: Dict[str, int]
     ) -> Dict[str, Dict]:
         """
         Identify partially downloaded files.
 
         Args:
             server_files: List of FileInfo objects from server
+            dl_sizes: Sizes of the server files found in the download directory
 
         Returns:
             Dictionary mapping filenames to partial download information
         """
         partial_downloads = {}
         for file in server_files:
-            local_path = os.path.join(self.download_dir, file.name)
-            if os.path.exists(local_path):
-                local_size = os.path.getsize(local_path)
-                if local_size < file.size:
-                    partial_downloads[file.name] = {
-                        "local_size": local_size,
-                        "server_size": file.size,
-                        "percent_complete": (
-                            (local_size / file.size) * 100 if file.size > 0 else 0
-                        ),
-                    }
+            local_size = dl_sizes.get(file.name)
+            if local_size is not None and local_size < file.size:
+                partial_downloads[file.name] = {
+                    "local_size": local_size,
+                    "server_size": file.size,
+                    "percent_complete": (
+                        (local_size / file.size) * 100 if file.size > 0 else 0
+                    ),
+                }
         return partial_downloads
 
-    def _determine_files_to_download(
+    def _plan_downloads(
         self,
         server_files: List[FileInfo],
+        server_names: Set[str],
         local_files: Set[str],
         partial_downloads: Dict[str, Dict],
-    ) -> List[FileInfo]:
+    ) -> Tuple[List[FileInfo], int]:
         """
-        Determine which files need to be downloaded.
+        Determine which files need to be downloaded and the total size to fetch.
 
         Args:
             server_files: List of FileInfo objects from server
+            server_names: Names of the files listed on the server
             local_files: Set of existing local filenames
             partial_downloads: Dictionary of partial download information
 
         Returns:
-            List of FileInfo objects to download
-        """
-        return [
-            file
-            for file in server_files
-            if file.name not in local_files or file.name in partial_downloads
-        ]
-
-    def _apply_regex_filter(self, files_to_download: List[FileInfo]) -> List[FileInfo]:
-        """
-        Apply regex filter to the files list based on configuration.
-
-        Args:
-            files_to_download: Original list of files to download
-
-        Returns:
-            Filtered list of files to download
-        """
-        # Check if filtering is enabled
-        filter_enabled = self.config.getboolean("FILTER", "enabled", fallback=False)
-        if not filter_enabled:
-            # If filtering is disabled, return an empty list (no files will be downloaded)
-            self.filtered_files = [file.name for file in files_to_download]
-            logger.warning(f"Filtering is disabled. No files will be downloaded.")
-            return []
-
-        # Get filter pattern and options
-        pattern = self.config.get("FILTER", "pattern", fallback=".*")
-        case_sensitive = self.config.getboolean(
-            "FILTER", "case_sensitive", fallback=False
-        )
-
-        try:
-            # Compile regex with appropriate flags
-            flags = 0 if case_sensitive else re.IGNORECASE
-            regex = re.compile(pattern, flags)
-
-            # Apply filter
-            matching_files = []
-            filtered_out = []
-
-            for file in files_to_download:
-                if regex.search(file.name):
-                    matching_files.append(file)
-                else:
-                    filtered_out.append(file)
-
-            # Store filtered filenames for reporting
-            self.filtered_files = [file.name for file in filtered_out]
-
-            # Report filter results
-            if filtered_out:
-                logger.info(
-                    f"Filtered out {len(filtered_out)} files using pattern: '{pattern}'"
-                )
-            logger.info(
-                f"Matched {len(matching_files)} files with pattern: '{pattern}'"
-            )
-
-            return matching_files
-
-        except re.error as e:
-            logger.error(f"Invalid regex pattern '{pattern}': {e}")
-            logger.warning("Regex filtering disabled due to invalid pattern")
-            self.filtered_files = [file.name for file in files_to_download]
-            return []
-
-    def _calculate_download_size(
-        self, files_to_download: List[FileInfo], partial_downloads: Dict[str, Dict]
-    ) -> int:
-        """
-        Calculate total size to download.
-
-        Args:
-            files_to_download: List of FileInfo objects to download
-            partial_downloads: Dictionary of partial download information
-
-        Returns:
-            Total size in bytes
+            Tuple of (files_to_download, total_size_in_bytes)
         """
+        # Files missing locally plus files that are only partially downloaded
+        needed = (server_names - local_files) | partial_downloads.keys()
+        if not needed:
+            return [], 0
+
+        # Keep the server listing order for the download queue and only count
+        # the remaining bytes of partial downloads
+        files_to_download = []
         total_size = 0
-        for file in files_to_download:
-            if file.name in partial_downloads:
-                # Only count remaining bytes for partial downloads
-                total_size += file.size - partial_downloads[file.name]["local_size"]
-            else:
-                total_size += file.size
-        return total_size
+        for file in server_files:
+            if file.name in needed:
+                files_to_download.append(file)
+                partial = partial_downloads.get(file.name)
+                total_size += file.size - (partial["local_size"] if partial else 0)
+
+        return files_to_download, total_size
 
     def _show_download_summary(
         self,
@@ -1162,15 +1908,15 @@ class FileSynchronizer:
             partial_downloads: Dictionary of partial download information
             total_size: Total size to download in bytes
         """
-        logger.info(f"Need to download {len(files_to_download)} files")
+        logger.info("Need to download %d files", len(files_to_download))
 
         # Show filtering info if applicable
-        if self.filtered_files:
-            logger.info(f"Excluded {len(self.filtered_files)} files by regex filter")
+        if self.filtered_count:
+            logger.info("Excluded %d files by regex filter", self.filtered_count)
 
         if partial_downloads:
             logger.info(
-                f"Including {len(partial_downloads)} partially downloaded files:"
+                "Including %d partially downloaded files:", len(partial_downloads)
             )
             for name, info in partial_downloads.items():
                 percent = info["percent_complete"]
@@ -1188,16 +1934,19 @@ class FileSynchronizer:
                     f"({format_size(info['local_size'])} of {format_size(info['server_size'])})"
                 )
 
-        logger.info(f"Total remaining download size: {format_size(total_size)}")
+        logger.info("Total remaining download size: %s", format_size(total_size))
         logger.info(
-            f"Files will be downloaded to: {Colors.BOLD}{os.path.abspath(self.download_dir)}{Colors.RESET}"
+            f"Files will be downloaded to: {Colors.BOLD}{self.abs_download_dir}{Colors.RESET}"
         )
         logger.info(
             f"Press {Colors.BOLD}{Colors.YELLOW}Ctrl+C{Colors.RESET} at any time to gracefully terminate"
         )
 
     def _download_files(
-        self, files_to_download: List[FileInfo], partial_downloads: Dict[str, Dict]
+        self,
+        files_to_download: List[FileInfo],
+        partial_downloads: Dict[str, Dict],
+        dl_sizes: Dict[str, int],
     ) -> bool:
         """
         Download the files.
@@ -1205,62 +1954,110 @@ class FileSynchronizer:
         Args:
             files_to_download: List of FileInfo objects to download
             partial_downloads: Dictionary of partial download information
+            dl_sizes: Sizes of the server files found in the download directory
 
         Returns:
             True if all downloads were successful, False otherwise
         """
         success_count = 0
+        total_files = len(files_to_download)
+
+        with ThreadPoolExecutor(max_workers=self.settings.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._download_file,
+                    i,
+                    total_files,
+                    file,
+                    dl_sizes.get(file.name, 0),
+                ): file
+                for i, file in enumerate(files_to_download, 1)
+            }
+
+            # Results are only tracked from this thread, so no locking is needed
+            for future in as_completed(futures):
+                # Files cancelled after termination were never started
+                if future.cancelled():
+                    continue
+
+                file = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Keep going with the other files if one worker fails
+                    logger.error("Unexpected error downloading %s: %s", file.name, e)
+                    result = False, 0
+
+                # Workers that picked up a file after termination never started it
+                if result is None:
+                    continue
+                success, bytes_downloaded = result
+
+                # Update tracking info
+                self.total_bytes_downloaded += bytes_downloaded
+
+                if success:
+                    success_count += 1
+                    self.downloaded_files.append(file.name)
+                else:
+                    self.failed_files.append(file.name)
 
-        for i, file in enumerate(files_to_download, 1):
-            if terminate_requested:
-                logger.warning(
-                    f"Termination requested - stopping after {success_count} of {len(files_to_download)} files"
-                )
-                return False
-
-            local_path = os.path.join(self.download_dir, file.name)
+                if TERMINATE.is_set():
+                    # Don't start any more downloads if termination was requested
+                    for pending in futures:
+                        pending.cancel()
 
-            # Calculate how much needs to be downloaded
-            existing_size = (
-                os.path.getsize(local_path) if os.path.exists(local_path) else 0
+        if TERMINATE.is_set():
+            logger.warning(
+                "Termination requested - stopped after %d of %d files",
+                success_count,
+                total_files,
             )
-            remaining_size = file.size - existing_size
+            return False
 
-            # Use colored output for file information
-            print(
-                f"{Colors.BOLD}File {i} of {len(files_to_download)}{Colors.RESET}: ",
-                end="",
-            )
-            if existing_size > 0:
-                percent = (existing_size / file.size) * 100
-                color = (
-                    Colors.GREEN
-                    if percent > 60
-                    else Colors.YELLOW if percent > 30 else Colors.RED
-                )
-                print(
-                    f"Resuming {Colors.CYAN}{file.name}{Colors.RESET} ({color}{percent:5.1f}%{Colors.RESET} complete, {format_size(remaining_size)} remaining)"
-                )
-            else:
-                print(
-                    f"Downloading {Colors.CYAN}{file.name}{Colors.RESET} ({file.formatted_size})"
-                )
+        return success_count == total_files
+
+    def _download_file(
+        self, index: int, total_files: int, file: FileInfo, existing_size: int
+    ) -> Optional[Tuple[bool, int]]:
+        """
+        Download a single file. Runs on a worker thread.
 
-            success, bytes_downloaded = self.downloader.download(file, local_path)
+        Args:
+            index: Position of the file in the download queue (1-based)
+            total_files: Number of files in the download queue
+            file: FileInfo object to download
+            existing_size: Size of the file already in the download directory
 
-            # Update tracking info
-            self.total_bytes_downloaded += bytes_downloaded
+        Returns:
+            Tuple of (success_status, bytes_downloaded), or None if termination
+            was requested before the download started
+        """
+        if TERMINATE.is_set():
+            return None
+
+        local_path = self._download_prefix + file.name
+
+        # Calculate how much needs to be downloaded
+        remaining_size = file.size - existing_size
+
+        # Use colored output for file information
+        header = f"{Colors.BOLD}File {index} of {total_files}{Colors.RESET}: "
+        if existing_size > 0:
+            percent = (existing_size / file.size) * 100
+            color = (
+                Colors.GREEN
+                if percent > 60
+                else Colors.YELLOW if percent > 30 else Colors.RED
+            )
+            message = f"Resuming {Colors.CYAN}{file.name}{Colors.RESET} ({color}{percent:5.1f}%{Colors.RESET} complete, {format_size(remaining_size)} remaining)"
+        else:
+            message = f"Downloading {Colors.CYAN}{file.name}{Colors.RESET} ({file.formatted_size})"
 
-            if success:
-                success_count += 1
-                self.downloaded_files.append(file.name)
-            else:
-                self.failed_files.append(file.name)
-                if terminate_requested:
-                    # Don't continue if termination was requested
-                    break
+        with console_lock:
+            print(header + message)
 
-        return success_count == len(files_to_download)
+        return self.downloader.download(file, local_path, existing_size)
 
     def _show_final_summary(self) -> None:
         """Show summary of the entire download operation."""
@@ -1274,7 +2071,7 @@ class FileSynchronizer:
         print("\n" + separator)
 
         # Determine completion status
-        if terminate_requested:
+        if TERMINATE.is_set():
             status_header = (
                 f"{Colors.YELLOW}DOWNLOAD OPERATION TERMINATED BY USER{Colors.RESET}"
             )
@@ -1289,37 +2086,38 @@ class FileSynchronizer:
 
         print(f"{Colors.BOLD}{status_header}{Colors.RESET}\n")
 
+        cyan = Colors.CYAN
+        reset = Colors.RESET
+
+        def write_names(names: List[str]) -> None:
+            # One write for the whole list instead of a print per file
+            sys.stdout.write("".join(f"  {cyan}{name}{reset}\n" for name in names))
+
         # Show successful downloads
         if self.downloaded_files:
             print(
                 f"{Colors.GREEN}Successfully downloaded files ({len(self.downloaded_files)}):{Colors.RESET}"
             )
-            for name in self.downloaded_files:
-                print(f"  {Colors.CYAN}{name}{Colors.RESET}")
+            write_names(self.downloaded_files)
 
         # Show failed downloads
         if self.failed_files:
             print(
                 f"\n{Colors.RED}Failed or incomplete files ({len(self.failed_files)}):{Colors.RESET}"
             )
-            for name in self.failed_files:
-                print(f"  {Colors.CYAN}{name}{Colors.RESET}")
+            write_names(self.failed_files)
 
         # Show filtered files
-        if self.filtered_files:
+        if self.filtered_count:
             print(
-                f"\n{Colors.YELLOW}Filtered out files ({len(self.filtered_files)}):{Colors.RESET}"
+                f"\n{Colors.YELLOW}Filtered out files ({self.filtered_count}):{Colors.RESET}"
             )
-            # Only show up to 10 filtered files to avoid flooding the console
-            if len(self.filtered_files) > 10:
-                for name in self.filtered_files[:10]:
-                    print(f"  {Colors.CYAN}{name}{Colors.RESET}")
+            # Only the first few filtered files are kept to avoid flooding the console
+            write_names(self.filtered_files)
+            if self.filtered_count > len(self.filtered_files):
                 print(
-                    f"  {Colors.YELLOW}...and {len(self.filtered_files) - 10} more{Colors.RESET}"
+                    f"  {Colors.YELLOW}...and {self.filtered_count - len(self.filtered_files)} more{Colors.RESET}"
                 )
-            else:
-                for name in self.filtered_files:
-                    print(f"  {Colors.CYAN}{name}{Colors.RESET}")
 
         # Show statistics
         print(f"\n{Colors.BOLD}Statistics:{Colors.RESET}")
@@ -1337,24 +2135,27 @@ class FileSynchronizer:
             )
 
         print(
-            f"  Files are available in: {Colors.BOLD}{os.path.abspath(self.download_dir)}{Colors.RESET}"
+            f"  Files are available in: {Colors.BOLD}{self.abs_download_dir}{Colors.RESET}"
         )
 
         # Show filter information
-        filter_enabled = self.config.getboolean("FILTER", "enabled", fallback=False)
-        if filter_enabled:
-            pattern = self.config.get("FILTER", "pattern", fallback=".*")
+        settings = self.settings
+        if settings.filter_enabled:
             sensitivity = (
                 "case-sensitive"
-                if self.config.getboolean("FILTER", "case_sensitive", fallback=False)
+                if settings.filter_case_sensitive
                 else "case-insensitive"
             )
-            print(f"  Filter: {Colors.BOLD}{pattern}{Colors.RESET} ({sensitivity})")
+            if settings.filter_anchored:
+                sensitivity += ", anchored"
+            print(
+                f"  Filter: {Colors.BOLD}{settings.filter_pattern}{Colors.RESET} ({sensitivity})"
+            )
         else:
             print(f"  Filter: {Colors.RED}Disabled{Colors.RESET}")
 
         # If terminated, show resume instructions
-        if terminate_requested and self.failed_files:
+        if TERMINATE.is_set() and self.failed_files:
             print(
                 f"\n{Colors.YELLOW}To resume downloading incomplete files, run the program again.{Colors.RESET}"
             )
@@ -1365,6 +2166,25 @@ class FileSynchronizer:
         print(separator)
 
 
+def _parse_bool(value: str) -> bool:
+    """
+    Parse a boolean configuration value the way ConfigParser.getboolean does.
+
+    Args:
+        value: Raw configuration value
+
+    Returns:
+        Parsed boolean
+
+    Raises:
+        ValueError: If the value is not a recognized boolean
+    """
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
+
+
 def format_size(size_bytes: int|float) -> str:
     """
     Format bytes into human-readable format.
@@ -1377,12 +2197,10 @@ def format_size(size_bytes: int|float) -> str:
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes/1024:6.1f} kiB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes/(1024*1024):6.1f} MiB"
-    else:
-        return f"{size_bytes/(1024*1024*1024):6.1f} GiB"
+
+    # Each unit covers 10 bits of magnitude
+    exponent = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / _SIZE_DIVISORS[exponent]:6.1f} {_SIZE_UNITS[exponent]}"
 
 
 def check_color_support():
@@ -1397,18 +2215,14 @@ def check_color_support():
             k.SetConsoleMode(k.GetStdHandle(-11), 7)
             return True
         except:
-            # If that didn't work, disable colors by setting them to empty strings
-            for attr in dir(Colors):
-                if not attr.startswith("__"):
-                    setattr(Colors, attr, "")
+            # If that didn't work, disable colors
+            disable_colors()
             return False
 
     # For non-Windows, check if the terminal supports colors
     if not sys.stdout.isatty():
         # Not a terminal, disable colors
-        for attr in dir(Colors):
-            if not attr.startswith("__"):
-                setattr(Colors, attr, "")
+        disable_colors()
         return False
 
     return True
@@ -1460,6 +2274,12 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Disable regex filtering (no files will be downloaded)",
     )
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Start downloading without asking for confirmation",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument(
         "--no-color", action="store_true", help="Disable colored output"
@@ -1485,7 +2305,12 @@ def validate_server_credentials(config: configparser.ConfigParser) -> bool:
     return bool(url and username and password)
 
 
-def test_server_connection(url: str, username: str, password: str) -> bool:
+def test_server_connection(
+    url: str,
+    username: str,
+    password: str,
+    session: Optional[requests.Session] = None,
+) -> bool:
     """
     Test the server connection with the provided credentials.
 
@@ -1493,16 +2318,18 @@ def test_server_connection(url: str, username: str, password: str) -> bool:
         url: Server URL
         username: Authentication username
         password: Authentication password
+        session: Optional session to test with, so its connection can be reused
 
     Returns:
         True if connection successful, False otherwise
     """
     try:
-        response = requests.get(url, auth=(username, password), timeout=10)
-        response.raise_for_status()
+        getter = session.get if session is not None else requests.get
+        with getter(url, auth=(username, password), timeout=10) as response:
+            response.raise_for_status()
         return True
     except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to connect to server: {e}")
+        logger.error("Failed to connect to server: %s", e)
         return False
 
 
@@ -1513,8 +2340,6 @@ def main() -> int:
     Returns:
         Exit code
     """
-    global terminate_requested
-
     args = parse_arguments()
 
     # Handle color settings
@@ -1522,9 +2347,7 @@ def main() -> int:
         check_color_support()
     else:
         # Disable colors if requested
-        for attr in dir(Colors):
-            if not attr.startswith("__"):
-                setattr(Colors, attr, "")
+        disable_colors()
 
     # Set up logging with appropriate level
     level = logging.DEBUG if args.verbose else logging.INFO
@@ -1541,33 +2364,28 @@ def main() -> int:
         config_manager = ConfigManager(args.config)
         config = config_manager.load()
 
-        # Apply command-line overrides
-        if args.url:
-            config["SERVER"]["url"] = args.url
-            config_manager.save()
-            logger.info(f"Updated server URL in config file: {args.url}")
-
-        if args.username:
-            config["SERVER"]["username"] = args.username
-            config_manager.save()
-            logger.info(f"Updated server username in config file: {args.username}")
-
-        if args.password:
-            config["SERVER"]["password"] = args.password
-            config_manager.save()
-            logger.info("Updated server password in config file")
-
-        if args.local_dir:
-            config["LOCAL"]["local_dir"] = args.local_dir
-            config_manager.save()
-            logger.info(f"Updated local directory in config file: {args.local_dir}")
-
-        if args.download_dir:
-            config["LOCAL"]["download_dir"] = args.download_dir
+        # Apply command line overrides: (section, key, value, label, log value)
+        overrides = (
+            ("SERVER", "url", args.url, "server URL", True),
+            ("SERVER", "username", args.username, "server username", True),
+            ("SERVER", "password", args.password, "server password", False),
+            ("LOCAL", "local_dir", args.local_dir, "local directory", True),
+            ("LOCAL", "download_dir", args.download_dir, "download directory", True),
+        )
+        updated = []
+        for section, key, value, label, show_value in overrides:
+            if value:
+                config[section][key] = value
+                updated.append((label, value if show_value else None))
+
+        # Write the config file once for all overrides
+        if updated:
             config_manager.save()
-            logger.info(
-                f"Updated download directory in config file: {args.download_dir}"
-            )
+            for label, value in updated:
+                if value is None:
+                    logger.info("Updated %s in config file", label)
+                else:
+                    logger.info("Updated %s in config file: %s", label, value)
 
         # Apply filter overrides
         if args.enable_filter:
@@ -1582,7 +2400,7 @@ def main() -> int:
             config["FILTER"]["enabled"] = "true"
             config["FILTER"]["pattern"] = args.filter
             logger.info(
-                f"Using regex filter pattern from command line: '{args.filter}'"
+                "Using regex filter pattern from command line: '%s'", args.filter
             )
 
         # Validate credentials
@@ -1592,68 +2410,87 @@ def main() -> int:
             )
             return 1
 
-        # Test server connection
-        logger.info(f"Testing connection to {config['SERVER']['url']}...")
-        if not test_server_connection(
-            config["SERVER"]["url"],
-            config["SERVER"]["username"],
-            config["SERVER"]["password"],
-        ):
-            logger.error(
-                "Connection test failed. Please check your server credentials."
-            )
-            retry = input(
-                f"{Colors.YELLOW}Do you want to update your server credentials? (y/n): {Colors.RESET}"
-            )
-            if retry.lower() == "y":
-                # Reset credentials and re-prompt
-                config["SERVER"]["url"] = ""
-                config["SERVER"]["username"] = ""
-                config["SERVER"]["password"] = ""
-                config_manager.save()
-                config_manager.prompt_for_missing_credentials()
-
-                # Test again with new credentials
-                if not test_server_connection(
-                    config["SERVER"]["url"],
-                    config["SERVER"]["username"],
-                    config["SERVER"]["password"],
-                ):
-                    logger.error("Connection test failed again. Exiting.")
+        # Initialize synchronizer, its session is also used for the connection test
+        synchronizer = FileSynchronizer(config, auto_confirm=args.yes)
+
+        try:
+            # Test server connection
+            settings = synchronizer.settings
+            logger.info("Testing connection to %s...", settings.url)
+            if not test_server_connection(
+                settings.url,
+                settings.username,
+                settings.password,
+                session=synchronizer.session,
+            ):
+                logger.error(
+                    "Connection test failed. Please check your server credentials."
+                )
+                # Never wipe the stored credentials without a human answering
+                if settings.auto_confirm:
+                    retry = "n"
+                else:
+                    retry = input(
+                        f"{Colors.YELLOW}Do you want to update your server credentials? (y/n): {Colors.RESET}"
+                    )
+                if retry.lower() == "y":
+                    # Reset credentials and re-prompt
+                    config["SERVER"]["url"] = ""
+                    config["SERVER"]["username"] = ""
+                    config["SERVER"]["password"] = ""
+                    config_manager.save()
+                    config_manager.prompt_for_missing_credentials()
+
+                    # Rebuild the synchronizer with the new credentials
+                    synchronizer.close()
+                    synchronizer = FileSynchronizer(config, auto_confirm=args.yes)
+                    settings = synchronizer.settings
+
+                    # Test again with new credentials
+                    if not test_server_connection(
+                        settings.url,
+                        settings.username,
+                        settings.password,
+                        session=synchronizer.session,
+                    ):
+                        logger.error("Connection test failed again. Exiting.")
+                        return 1
+                else:
                     return 1
+
+            # Log filter status
+            if settings.filter_enabled:
+                sensitivity = (
+                    "case-sensitive"
+                    if settings.filter_case_sensitive
+                    else "case-insensitive"
+                )
+                logger.info(
+                    "Regex filtering enabled with %s%s pattern: '%s'",
+                    sensitivity,
+                    " anchored" if settings.filter_anchored else "",
+                    settings.filter_pattern,
+                )
             else:
-                return 1
-
-        # Log filter status
-        filter_enabled = config.getboolean("FILTER", "enabled", fallback=False)
-        if filter_enabled:
-            pattern = config.get("FILTER", "pattern", fallback=".*")
-            case_sensitive = config.getboolean(
-                "FILTER", "case_sensitive", fallback=False
-            )
-            sensitivity = "case-sensitive" if case_sensitive else "case-insensitive"
-            logger.info(
-                f"Regex filtering enabled with {sensitivity} pattern: '{pattern}'"
-            )
-        else:
-            logger.warning(
-                f"Regex filtering is DISABLED. No files will be downloaded unless enabled."
-            )
+                logger.warning(
+                    "Regex filtering is DISABLED. No files will be downloaded unless enabled."
+                )
 
-        # Initialize synchronizer
-        synchronizer = FileSynchronizer(config)
+            # Perform synchronization
+            synced = synchronizer.sync(args.extension)
+        finally:
+            synchronizer.close()
 
-        # Perform synchronization
-        if synchronizer.sync(args.extension):
+        if synced:
             return 0
         else:
             # Check if termination was requested
-            if terminate_requested:
+            if TERMINATE.is_set():
                 return 2  # Special code for user-requested termination
             return 1
 
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         if logging.getLogger().isEnabledFor(logging.DEBUG):
             import traceback
 
@@ -1667,6 +2504,6 @@ if __name__ == "__main__":
         sys.exit(exit_code)
     except KeyboardInterrupt:
         # This should rarely be reached because we handle Ctrl+C with the signal handler
-        terminate_requested = True
+        TERMINATE.set()
         print(f"\n\n{Colors.YELLOW}Process interrupted by user.{Colors.RESET}")
         sys.exit(2)